@@ -1,4 +1,6 @@
-from .client import RevrseAI
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     APIError,
     AuthenticationError,
@@ -10,9 +12,15 @@ from .exceptions import (
     ValidationError,
 )
 
+if TYPE_CHECKING:
+    from .async_client import AsyncRevrseAI
+    from .client import ExecuteRequest, RevrseAI
+
 __version__ = "0.1.1"
 __all__ = [
     "RevrseAI",
+    "AsyncRevrseAI",
+    "ExecuteRequest",
     "RevrseAIError",
     "AuthenticationError",
     "AuthorizationError",
@@ -23,3 +31,25 @@ __all__ = [
     "APIError",
     "__version__",
 ]
+
+
+# The clients pull in httpx and pydantic, so they are only imported on first
+# access. This keeps `import revrseai` (e.g. for the exceptions) cheap.
+_SUBMODULES = {
+    "RevrseAI": ".client",
+    "AsyncRevrseAI": ".async_client",
+    "ExecuteRequest": ".client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,111 @@
+"""In-memory cache for idempotent GET responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+# How long an expired entry may still be served when the API is failing.
+_STALE_IF_ERROR = 300.0
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body along with its freshness metadata."""
+
+    payload: bytes
+    expires_at: float
+    etag: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be served without contacting the API."""
+        return time.monotonic() < self.expires_at
+
+    @property
+    def usable_on_error(self) -> bool:
+        """Whether the entry can stand in for a failed revalidation."""
+        return time.monotonic() < self.expires_at + _STALE_IF_ERROR
+
+
+def cache_key(endpoint: str, params: dict[str, Any] | None) -> CacheKey:
+    """Build the cache key identifying a GET request."""
+    return endpoint, tuple(sorted((params or {}).items()))
+
+
+def cache_ttl(response: httpx.Response, default: float) -> float | None:
+    """Return how long a response may be cached, honoring Cache-Control.
+
+    Returns None if the response must not be stored at all.
+    """
+    cache_control = response.headers.get("Cache-Control")
+    if not cache_control:
+        return default
+
+    ttl = default
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "no-store":
+            return None
+        if name == "no-cache":
+            ttl = 0.0
+        elif name == "max-age":
+            try:
+                ttl = float(value.strip('"'))
+            except ValueError:
+                pass
+    return ttl
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of GET response bodies with a per-entry TTL."""
+
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        """Return the entry stored under key, fresh or not."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: CacheKey, response: httpx.Response, ttl: float) -> None:
+        """Cache the body of a successful response for up to ttl seconds."""
+        ttl_or_none = cache_ttl(response, ttl)
+        if ttl_or_none is None:
+            self.invalidate(key)
+            return
+        entry = CacheEntry(
+            response.content,
+            time.monotonic() + ttl_or_none,
+            response.headers.get("ETag"),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def revalidated(
+        self, entry: CacheEntry, response: httpx.Response, ttl: float
+    ) -> bytes:
+        """Refresh an entry after a 304 Not Modified and return its body."""
+        entry.expires_at = time.monotonic() + (cache_ttl(response, ttl) or 0.0)
+        return entry.payload
+
+    def invalidate(self, key: CacheKey | None = None) -> None:
+        """Drop a single entry, or every entry if key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
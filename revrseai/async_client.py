@@ -0,0 +1,390 @@
+import asyncio
+import os
+from collections.abc import Iterable
+from typing import Any
+
+import httpx
+
+from revrseai._cache import CacheEntry, CacheKey, ResponseCache, cache_key
+from revrseai.client import (
+    _BASE_URL,
+    _INFO_TTL,
+    _TASK_LIST_ADAPTER,
+    _TASK_TTL,
+    _TASKS_TTL,
+    ExecuteRequest,
+    _handle_response_errors,
+    _retry_delay,
+)
+from revrseai.models import Info, Response, Task, TaskDetailed
+
+
+class AsyncRevrseAI:
+    """Asynchronous client for interacting with the RevrseAI API.
+
+    This client mirrors RevrseAI but its methods are coroutines, so several
+    calls can run concurrently over a single HTTP/2 connection:
+
+        async with AsyncRevrseAI() as client:
+            results = await asyncio.gather(
+                *(client.execute(endpoint_id=eid, data=d) for d in inputs)
+            )
+
+    Models returned by this client are not bound to it, so helpers such as
+    Task.wait_till_done() or Endpoint.execute() are only available on models
+    returned by the synchronous RevrseAI client.
+
+    Attributes:
+        api_key: The API key used for authentication.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        timeout: float | None = 30.0,
+        max_retries: int = 5,
+    ):
+        """Initialize the asynchronous RevrseAI client.
+
+        Args:
+            api_key: The API key for authentication. If not provided,
+                will attempt to read from the REVRSE_AI_API_KEY environment variable.
+            timeout: Timeout in seconds for each HTTP request. Pass None to
+                wait indefinitely.
+            max_retries: How many times a read-only request (get_tasks,
+                get_task, get_task_basic, info) is retried after a 429, 502,
+                503 or 504 response. Pass 0 to disable retries.
+
+        Raises:
+            ValueError: If no API key is provided and none is found in
+                environment variables.
+        """
+        self.api_key = api_key or os.getenv("REVRSE_AI_API_KEY")
+        if not self.api_key:
+            raise ValueError("API key is required")
+
+        self._max_retries = max_retries
+        self._cache = ResponseCache()
+        self._inflight: dict[CacheKey, asyncio.Task[bytes]] = {}
+        self._http = httpx.AsyncClient(
+            base_url=_BASE_URL,
+            http2=True,
+            follow_redirects=True,
+            headers={"X-API-Key": self.api_key},
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=timeout,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncRevrseAI":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def invalidate_cache(self) -> None:
+        """Discard all cached GET responses so the next calls hit the API."""
+        self._cache.invalidate()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        retry: bool = False,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures if retry is set.
+
+        Only the read-only GETs made by _fetch_cached pass retry=True.
+        """
+        attempt = 0
+        while True:
+            response = await self._http.request(
+                method, endpoint, json=data, params=params, headers=headers
+            )
+            if not retry:
+                return response
+            delay = _retry_delay(response, attempt, self._max_retries)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _request_bytes(
+        self,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        method: str | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> bytes:
+        """Make an HTTP request to the RevrseAI API.
+
+        See RevrseAI._request_bytes for the arguments and raised exceptions.
+        """
+        method = method or ("POST" if data else "GET")
+        response = await self._send(method, endpoint, data=data, params=params)
+
+        _handle_response_errors(response)
+        return response.content
+
+    async def _cached_get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        ttl: float = _TASK_TTL,
+        use_cache: bool = True,
+    ) -> bytes:
+        """Make a GET request, serving the response body from cache when fresh.
+
+        See RevrseAI._cached_get for the caching rules.
+        """
+        key = cache_key(endpoint, params)
+        entry = self._cache.get(key)
+        if use_cache and entry is not None and entry.fresh:
+            return entry.payload
+
+        # Concurrent callers await the same task; shielding it means one
+        # caller being cancelled doesn't cancel the request for the others.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_cached(key, entry, endpoint, params, ttl, use_cache)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_cached(
+        self,
+        key: CacheKey,
+        entry: CacheEntry | None,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        ttl: float,
+        use_cache: bool,
+    ) -> bytes:
+        """Fetch a GET response from the API and update its cache entry."""
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else None
+        try:
+            response = await self._send(
+                "GET", endpoint, params=params, headers=headers, retry=True
+            )
+        except httpx.TransportError:
+            if use_cache and entry is not None and entry.usable_on_error:
+                return entry.payload
+            raise
+
+        if entry is not None:
+            if response.status_code == 304:
+                return self._cache.revalidated(entry, response, ttl)
+            if use_cache and response.status_code >= 500 and entry.usable_on_error:
+                return entry.payload
+
+        _handle_response_errors(response)
+        self._cache.store(key, response, ttl)
+        return response.content
+
+    async def get_tasks(self, use_cache: bool = True) -> list[Task]:
+        """Retrieve all tasks associated with the authenticated user.
+
+        Args:
+            use_cache: If False, bypass the response cache and fetch the
+                list from the API.
+
+        Returns:
+            A list of Task objects representing all available tasks.
+        """
+        response = await self._cached_get(
+            "/api/tasks", ttl=_TASKS_TTL, use_cache=use_cache
+        )
+        return _TASK_LIST_ADAPTER.validate_json(response)
+
+    async def get_task(self, task_id: str, use_cache: bool = True) -> TaskDetailed:
+        """Retrieve a task with full details including messages and endpoints.
+
+        Args:
+            task_id: The unique identifier of the task to retrieve.
+            use_cache: If False, bypass the response cache and fetch the
+                task from the API.
+
+        Returns:
+            A TaskDetailed object containing the task with all associated
+            messages and endpoints.
+        """
+        response = await self._cached_get(
+            f"/api/tasks/{task_id}",
+            params={"include_details": True},
+            ttl=_TASK_TTL,
+            use_cache=use_cache,
+        )
+        return TaskDetailed.model_validate_json(response)
+
+    async def get_task_basic(self, task_id: str, use_cache: bool = True) -> Task:
+        """Retrieve a task without detailed information.
+
+        Args:
+            task_id: The unique identifier of the task to retrieve.
+            use_cache: If False, bypass the response cache and fetch the
+                task from the API.
+
+        Returns:
+            A Task object containing basic task information.
+        """
+        response = await self._cached_get(
+            f"/api/tasks/{task_id}",
+            params={"include_details": False},
+            ttl=_TASK_TTL,
+            use_cache=use_cache,
+        )
+        return Task.model_validate_json(response)
+
+    async def generate(self, task: str, secrets: dict[str, Any] | None = None) -> Task:
+        """Generate a new task from a natural language description.
+
+        Args:
+            task: A natural language description of what you want to accomplish.
+            secrets: Optional dictionary of secrets (e.g., passwords) needed
+                for the task execution.
+
+        Returns:
+            A Task object representing the newly created task. Poll
+            get_task_basic(use_cache=False) until its task_stage is DONE.
+        """
+        result = Task.model_validate_json(
+            await self._request_bytes(
+                "/generate", data={"task": task, "secrets": secrets}
+            )
+        )
+        # The task list changed; don't serve it from cache.
+        self._cache.invalidate()
+        return result
+
+    async def execute(
+        self,
+        app: str | None = None,
+        task_id: str | None = None,
+        endpoint_id: str | None = None,
+        endpoint: str | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> Response:
+        """Execute an API endpoint with the provided data.
+
+        See RevrseAI.execute for the three ways of addressing the endpoint.
+
+        Args:
+            app: The name of the app to execute against.
+            task_id: The task ID containing the endpoint to execute.
+            endpoint_id: The direct endpoint ID to execute.
+            endpoint: The endpoint name (required when using app or task_id).
+            data: Optional input data to pass to the endpoint.
+
+        Returns:
+            A Response object containing the execution result.
+
+        Raises:
+            ValueError: If neither app, task_id, nor endpoint_id is provided,
+                or if endpoint is missing when using task_id.
+        """
+        if app is None and task_id is None and endpoint_id is None:
+            raise ValueError("Either app, task_id, or endpoint_id is required")
+        if endpoint_id is not None:
+            return await self.execute_from_endpoint_id(endpoint_id, data)
+        elif task_id is not None:
+            if endpoint is None:
+                raise ValueError("endpoint is required when using task_id")
+            return await self.execute_from_task_id(task_id, endpoint, data)
+        else:
+            return Response.model_validate_json(
+                await self._request_bytes(
+                    "/execute", data={"app": app, "endpoint": endpoint, "data": data}
+                )
+            )
+
+    async def execute_from_task_id(
+        self, task_id: str, endpoint: str, data: dict[str, Any] | None = None
+    ) -> Response:
+        """Execute an endpoint by task ID and endpoint name.
+
+        Args:
+            task_id: The unique identifier of the task.
+            endpoint: The name of the endpoint to execute within the task.
+            data: Optional input data to pass to the endpoint.
+
+        Returns:
+            A Response object containing the execution result.
+        """
+        return Response.model_validate_json(
+            await self._request_bytes(f"/execute/{task_id}/{endpoint}", data=data)
+        )
+
+    async def execute_from_endpoint_id(
+        self, endpoint_id: str, data: dict[str, Any] | None = None
+    ) -> Response:
+        """Execute an endpoint directly by its unique ID.
+
+        Args:
+            endpoint_id: The unique identifier of the endpoint to execute.
+            data: Optional input data to pass to the endpoint.
+
+        Returns:
+            A Response object containing the execution result.
+        """
+        return Response.model_validate_json(
+            await self._request_bytes(f"/execute/{endpoint_id}", data=data)
+        )
+
+    async def execute_many(
+        self, requests: Iterable[ExecuteRequest], max_concurrency: int = 10
+    ) -> list[Response]:
+        """Execute several endpoints concurrently.
+
+        Each request holds the keyword arguments of one execute() call.
+
+        Args:
+            requests: The execute() arguments for each call.
+            max_concurrency: The maximum number of calls in flight at once.
+
+        Returns:
+            The Response for each request, in the same order as requests.
+
+        Raises:
+            RevrseAIError: The first error raised by any of the calls. The
+                calls still pending are cancelled.
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(request: ExecuteRequest) -> Response:
+            async with semaphore:
+                return await self.execute(**request)
+
+        tasks = [asyncio.ensure_future(run(r)) for r in requests]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            # gather leaves the other calls running when one fails.
+            for task in tasks:
+                task.cancel()
+
+    async def info(self, query: str, use_cache: bool = True) -> Info:
+        """Retrieve information about an app and its available endpoints.
+
+        Args:
+            query: The app name or search query to look up.
+            use_cache: If False, bypass the response cache and fetch the
+                info from the API.
+
+        Returns:
+            An Info object containing app details and a list of available endpoints.
+        """
+        response = await self._cached_get(
+            "/api/info", params={"query": query}, ttl=_INFO_TTL, use_cache=use_cache
+        )
+        return Info.model_validate_json(response)
@@ -1,14 +1,24 @@
 import os
-from typing import Any
-
-import requests
-
+import random
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, TypedDict
+
+import httpx
+from pydantic import TypeAdapter
+
+from revrseai._cache import CacheEntry, CacheKey, ResponseCache, cache_key
 from revrseai.exceptions import (
     APIError,
     AuthenticationError,
     AuthorizationError,
     NotFoundError,
     RateLimitError,
+    RevrseAIError,
     ServerError,
     ValidationError,
 )
@@ -16,6 +26,92 @@ from revrseai.models import Info, Response, Task, TaskDetailed
 
 _BASE_URL = "https://api.revrse.ai"
 
+# Transient failures are retried for read-only requests only, with
+# exponential backoff and jitter between attempts. /generate and /execute are
+# never retried: a gateway error there may come after the action already ran.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+
+# Seconds GET responses are cached for, unless the API's Cache-Control says
+# otherwise. Task state changes while it is being generated, app info rarely.
+_TASKS_TTL = 10.0
+_TASK_TTL = 5.0
+_INFO_TTL = 300.0
+
+_TASK_LIST_ADAPTER = TypeAdapter(list[Task])
+
+
+class ExecuteRequest(TypedDict, total=False):
+    """Keyword arguments for one RevrseAI.execute call in execute_many."""
+
+    app: str
+    task_id: str
+    endpoint_id: str
+    endpoint: str
+    data: dict[str, Any] | None
+
+
+def _parse_retry_after(value: str) -> float:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return (retry_at - datetime.now(UTC)).total_seconds()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _retry_delay(
+    response: httpx.Response, attempt: int, max_retries: int
+) -> float | None:
+    """Return the seconds to wait before retrying a request, or None to give up.
+
+    A Retry-After header sent by the server takes precedence over the computed
+    backoff. If it asks for a longer wait than _RETRY_MAX_DELAY, the request is
+    not retried so the caller sees the RateLimitError/ServerError instead of
+    blocking.
+    """
+    if attempt >= max_retries or response.status_code not in _RETRY_STATUSES:
+        return None
+
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        delay = _parse_retry_after(retry_after)
+        return max(delay, 0.0) if delay <= _RETRY_MAX_DELAY else None
+
+    delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2.0**attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+
+_STATUS_ERRORS: dict[int, type[RevrseAIError]] = {
+    401: AuthenticationError,
+    403: AuthorizationError,
+    404: NotFoundError,
+    422: ValidationError,
+    429: RateLimitError,
+}
+
+
+def _handle_response_errors(response: httpx.Response) -> None:
+    """Check response for errors and raise appropriate exceptions."""
+    if response.is_success:
+        return
+
+    status_code = response.status_code
+    try:
+        detail = response.json().get("detail") or response.text
+    except Exception:
+        detail = response.text or "Unknown error"
+
+    error = _STATUS_ERRORS.get(status_code) or (
+        ServerError if status_code >= 500 else APIError
+    )
+    raise error(detail, status_code, detail)
+
 
 class RevrseAI:
     """Client for interacting with the RevrseAI API.
@@ -27,12 +123,22 @@ class RevrseAI:
         api_key: The API key used for authentication.
     """
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        timeout: float | None = 30.0,
+        max_retries: int = 5,
+    ):
         """Initialize the RevrseAI client.
 
         Args:
             api_key: The API key for authentication. If not provided,
                 will attempt to read from the REVRSE_AI_API_KEY environment variable.
+            timeout: Timeout in seconds for each HTTP request. Pass None to
+                wait indefinitely.
+            max_retries: How many times a read-only request (get_tasks,
+                get_task, get_task_basic, info) is retried after a 429, 502,
+                503 or 504 response. Pass 0 to disable retries.
 
         Raises:
             ValueError: If no API key is provided and none is found in
@@ -42,15 +148,71 @@ class RevrseAI:
         if not self.api_key:
             raise ValueError("API key is required")
 
-    def _request(
+        self._max_retries = max_retries
+        self._cache = ResponseCache()
+        self._inflight: dict[CacheKey, Future[bytes]] = {}
+        self._inflight_lock = threading.Lock()
+        self._http = httpx.Client(
+            base_url=_BASE_URL,
+            http2=True,
+            follow_redirects=True,
+            headers={"X-API-Key": self.api_key},
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=timeout,
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        self._http.close()
+
+    def __enter__(self) -> "RevrseAI":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def invalidate_cache(self) -> None:
+        """Discard all cached GET responses so the next calls hit the API."""
+        self._cache.invalidate()
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        retry: bool = False,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures if retry is set.
+
+        Only the read-only GETs made by _fetch_cached pass retry=True.
+        """
+        attempt = 0
+        while True:
+            response = self._http.request(
+                method, endpoint, json=data, params=params, headers=headers
+            )
+            if not retry:
+                return response
+            delay = _retry_delay(response, attempt, self._max_retries)
+            if delay is None:
+                return response
+            time.sleep(delay)
+            attempt += 1
+
+    def _request_bytes(
         self,
         endpoint: str,
         data: dict[str, Any] | None = None,
         method: str | None = None,
         params: dict[str, Any] | None = None,
-    ) -> Any:
+    ) -> bytes:
         """Make an HTTP request to the RevrseAI API.
 
+        The request is never retried, whatever its method, since it may
+        trigger an action in the app.
+
         Args:
             endpoint: The API endpoint path (e.g., "/api/tasks").
             data: Optional JSON body data for POST requests.
@@ -58,7 +220,7 @@ class RevrseAI:
             params: Optional query parameters.
 
         Returns:
-            The JSON response from the API.
+            The raw JSON body of the response.
 
         Raises:
             AuthenticationError: If authentication fails (401).
@@ -69,71 +231,129 @@ class RevrseAI:
             ServerError: If a server error occurs (5xx).
             APIError: For other API errors.
         """
-        url = f"{_BASE_URL}{endpoint}"
-        headers = {"X-API-Key": self.api_key}
         method = method or ("POST" if data else "GET")
-        response = requests.request(
-            method, url, json=data, headers=headers, params=params
-        )
+        response = self._send(method, endpoint, data=data, params=params)
 
-        self._handle_response_errors(response)
-        return response.json()
+        _handle_response_errors(response)
+        return response.content
 
-    def _handle_response_errors(self, response: requests.Response) -> None:
-        """Check response for errors and raise appropriate exceptions."""
-        if response.ok:
-            return
+    def _cached_get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        ttl: float = _TASK_TTL,
+        use_cache: bool = True,
+    ) -> bytes:
+        """Make a GET request, serving the response body from cache when fresh.
+
+        Expired entries carrying an ETag are revalidated with If-None-Match.
+        If the API fails with a server or network error, a recently expired
+        entry is returned instead of raising. Concurrent calls for the same
+        request share a single in-flight HTTP request.
+
+        Args:
+            endpoint: The API endpoint path (e.g., "/api/tasks").
+            params: Optional query parameters.
+            ttl: Seconds to cache the response for, unless the response's
+                Cache-Control header says otherwise.
+            use_cache: If False, always contact the API to refresh the entry.
+
+        Returns:
+            The raw JSON body of the response.
+        """
+        key = cache_key(endpoint, params)
+        entry = self._cache.get(key)
+        if use_cache and entry is not None and entry.fresh:
+            return entry.payload
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+        if not is_leader:
+            return future.result()
 
-        status_code = response.status_code
         try:
-            error_data = response.json()
-            detail = error_data.get("detail", str(error_data))
-        except Exception:
-            detail = response.text or "Unknown error"
-
-        if status_code == 401:
-            raise AuthenticationError(detail, status_code, detail)
-        elif status_code == 403:
-            raise AuthorizationError(detail, status_code, detail)
-        elif status_code == 404:
-            raise NotFoundError(detail, status_code, detail)
-        elif status_code == 422:
-            raise ValidationError(detail, status_code, detail)
-        elif status_code == 429:
-            raise RateLimitError(detail, status_code, detail)
-        elif status_code >= 500:
-            raise ServerError(detail, status_code, detail)
+            payload = self._fetch_cached(key, entry, endpoint, params, ttl, use_cache)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
         else:
-            raise APIError(detail, status_code, detail)
+            future.set_result(payload)
+            return payload
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
-    def get_tasks(self) -> list[Task]:
+    def _fetch_cached(
+        self,
+        key: CacheKey,
+        entry: CacheEntry | None,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        ttl: float,
+        use_cache: bool,
+    ) -> bytes:
+        """Fetch a GET response from the API and update its cache entry."""
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else None
+        try:
+            response = self._send(
+                "GET", endpoint, params=params, headers=headers, retry=True
+            )
+        except httpx.TransportError:
+            if use_cache and entry is not None and entry.usable_on_error:
+                return entry.payload
+            raise
+
+        if entry is not None:
+            if response.status_code == 304:
+                return self._cache.revalidated(entry, response, ttl)
+            if use_cache and response.status_code >= 500 and entry.usable_on_error:
+                return entry.payload
+
+        _handle_response_errors(response)
+        self._cache.store(key, response, ttl)
+        return response.content
+
+    def get_tasks(self, use_cache: bool = True) -> list[Task]:
         """Retrieve all tasks associated with the authenticated user.
 
+        Args:
+            use_cache: If False, bypass the response cache and fetch the
+                list from the API.
+
         Returns:
             A list of Task objects representing all available tasks.
         """
-        return [Task.model_validate(t) for t in self._request("/api/tasks")]
+        response = self._cached_get("/api/tasks", ttl=_TASKS_TTL, use_cache=use_cache)
+        return _TASK_LIST_ADAPTER.validate_json(response)
 
-    def get_task(self, task_id: str) -> TaskDetailed:
+    def get_task(self, task_id: str, use_cache: bool = True) -> TaskDetailed:
         """Retrieve a task with full details including messages and endpoints.
 
         Args:
             task_id: The unique identifier of the task to retrieve.
+            use_cache: If False, bypass the response cache and fetch the
+                task from the API.
 
         Returns:
             A TaskDetailed object containing the task with all associated
             messages and endpoints.
         """
-        response = self._request(
-            f"/api/tasks/{task_id}", params={"include_details": True}
+        response = self._cached_get(
+            f"/api/tasks/{task_id}",
+            params={"include_details": True},
+            ttl=_TASK_TTL,
+            use_cache=use_cache,
         )
-        task = TaskDetailed.model_validate(response)
+        task = TaskDetailed.model_validate_json(response)
         task._client = self
         for endpoint in task.endpoints:
             endpoint._client = self
         return task
 
-    def get_task_basic(self, task_id: str) -> Task:
+    def get_task_basic(self, task_id: str, use_cache: bool = True) -> Task:
         """Retrieve a task without detailed information.
 
         This is a lighter-weight alternative to get_task() when you don't
@@ -141,14 +361,19 @@ class RevrseAI:
 
         Args:
             task_id: The unique identifier of the task to retrieve.
+            use_cache: If False, bypass the response cache and fetch the
+                task from the API.
 
         Returns:
             A Task object containing basic task information.
         """
-        response = self._request(
-            f"/api/tasks/{task_id}", params={"include_details": False}
+        response = self._cached_get(
+            f"/api/tasks/{task_id}",
+            params={"include_details": False},
+            ttl=_TASK_TTL,
+            use_cache=use_cache,
         )
-        task = Task.model_validate(response)
+        task = Task.model_validate_json(response)
         task._client = self
         return task
 
@@ -167,9 +392,11 @@ class RevrseAI:
             A Task object representing the newly created task. Use wait_till_done()
             to wait for generation to complete.
         """
-        result = Task.model_validate(
-            self._request("/generate", data={"task": task, "secrets": secrets})
+        result = Task.model_validate_json(
+            self._request_bytes("/generate", data={"task": task, "secrets": secrets})
         )
+        # The task list changed; don't serve it from cache.
+        self._cache.invalidate()
         result._client = self
         return result
 
@@ -212,8 +439,8 @@ class RevrseAI:
                 raise ValueError("endpoint is required when using task_id")
             return self.execute_from_task_id(task_id, endpoint, data)
         else:
-            return Response.model_validate(
-                self._request(
+            return Response.model_validate_json(
+                self._request_bytes(
                     "/execute", data={"app": app, "endpoint": endpoint, "data": data}
                 )
             )
@@ -231,8 +458,8 @@ class RevrseAI:
         Returns:
             A Response object containing the execution result.
         """
-        return Response.model_validate(
-            self._request(f"/execute/{task_id}/{endpoint}", data=data)
+        return Response.model_validate_json(
+            self._request_bytes(f"/execute/{task_id}/{endpoint}", data=data)
         )
 
     def execute_from_endpoint_id(
@@ -247,20 +474,57 @@ class RevrseAI:
         Returns:
             A Response object containing the execution result.
         """
-        return Response.model_validate(
-            self._request(f"/execute/{endpoint_id}", data=data)
+        return Response.model_validate_json(
+            self._request_bytes(f"/execute/{endpoint_id}", data=data)
         )
 
-    def info(self, query: str) -> Info:
+    def execute_many(
+        self, requests: Iterable[ExecuteRequest], max_concurrency: int = 10
+    ) -> list[Response]:
+        """Execute several endpoints concurrently.
+
+        Each request holds the keyword arguments of one execute() call. The
+        calls run on a pool of threads sharing this client's connections.
+
+        Args:
+            requests: The execute() arguments for each call.
+            max_concurrency: The maximum number of calls in flight at once.
+
+        Returns:
+            The Response for each request, in the same order as requests.
+
+        Raises:
+            RevrseAIError: The error of the first call to fail. Calls that
+                have not started yet are cancelled, and the error is raised
+                once the calls already running have finished.
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            futures = [executor.submit(self.execute, **r) for r in requests]
+            for future in as_completed(futures):
+                future.result()
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def info(self, query: str, use_cache: bool = True) -> Info:
         """Retrieve information about an app and its available endpoints.
 
         Args:
             query: The app name or search query to look up.
+            use_cache: If False, bypass the response cache and fetch the
+                info from the API.
 
         Returns:
             An Info object containing app details and a list of available endpoints.
         """
-        info = Info.model_validate(self._request("/api/info", params={"query": query}))
+        response = self._cached_get(
+            "/api/info", params={"query": query}, ttl=_INFO_TTL, use_cache=use_cache
+        )
+        info = Info.model_validate_json(response)
         for endpoint in info.endpoints:
             endpoint._client = self
         return info
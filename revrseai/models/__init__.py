@@ -1,9 +1,13 @@
-from .endpoint import Endpoint
-from .info import Info
-from .message import Message
-from .response import Response
-from .schema import SchemaObject
-from .task import Task, TaskDetailed
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .endpoint import Endpoint
+    from .info import Info
+    from .message import Message
+    from .response import Response
+    from .schema import SchemaObject
+    from .task import Task, TaskDetailed
 
 __all__ = [
     "Task",
@@ -14,3 +18,28 @@ __all__ = [
     "SchemaObject",
     "Info",
 ]
+
+# Maps each exported name to the submodule defining it; submodules (and
+# pydantic with them) are imported on first access.
+_SUBMODULES = {
+    "Task": ".task",
+    "TaskDetailed": ".task",
+    "Message": ".message",
+    "Endpoint": ".endpoint",
+    "Response": ".response",
+    "SchemaObject": ".schema",
+    "Info": ".info",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,8 +1,10 @@
-import json
-from typing import TYPE_CHECKING, Any
+import textwrap
+from collections.abc import Mapping
+from functools import cached_property
+from typing import TYPE_CHECKING, Annotated, Any, Self
 from uuid import UUID
 
-from pydantic import BaseModel, Field, PrivateAttr, field_validator
+from pydantic import BaseModel, BeforeValidator, Field, PrivateAttr
 
 from .response import Response
 from .schema import SchemaObject
@@ -10,6 +12,78 @@ from .schema import SchemaObject
 if TYPE_CHECKING:
     from revrseai.client import RevrseAI
 
+# Generated documentation is written to disk in one encoded chunk through
+# a 64 KiB buffer.
+_EXPORT_BUFFER_SIZE = 64 * 1024
+
+# Layout of Endpoint.make_markdown_documentation; only the fields vary.
+_DOC_TEMPLATE = """\
+# {name}
+
+{description}## Input
+
+{input_table}
+
+### Code Example
+
+```python
+from revrseai import RevrseAI
+
+client = RevrseAI("YOUR_API_KEY")
+resp = client.execute(
+    endpoint_id="{endpoint_id}",
+    data={data}
+)
+print(resp)
+```
+
+## Output
+
+{output_table}
+
+### Example Response
+
+```json
+{example_response}
+```"""
+
+
+def _copy_json(value: Any) -> Any:
+    """Return a deep copy of a JSON-like value built from dicts and lists.
+
+    Schema examples only hold dicts, lists and immutable scalars, so this
+    skips the memo and type dispatch that copy.deepcopy goes through.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+def _parse_schema(v: Any) -> SchemaObject:
+    """Validate and parse schema fields into SchemaObject instances.
+
+    Args:
+        v: The raw schema value, either a dict or SchemaObject.
+
+    Returns:
+        A SchemaObject instance parsed from the input.
+
+    Raises:
+        ValueError: If the input is neither a dict nor a SchemaObject.
+    """
+    if isinstance(v, dict):
+        return SchemaObject.from_dict(v)
+    if not isinstance(v, SchemaObject):
+        raise ValueError(f"Expected dict or SchemaObject, got {type(v)}")
+    return v
+
+
+# Attached to the field type so pydantic-core calls the parser directly rather
+# than dispatching through a model-level field_validator.
+_Schema = Annotated[SchemaObject, BeforeValidator(_parse_schema)]
+
 
 class Endpoint(BaseModel):
     """Information about an API endpoint."""
@@ -21,32 +95,27 @@ class Endpoint(BaseModel):
     description: str | None = Field(
         default=None, description="Description of what this endpoint does"
     )
-    input_schema: SchemaObject = Field(
-        description="JSON schema for the input parameters"
-    )
-    output_schema: SchemaObject = Field(
-        description="JSON schema for the output response"
-    )
-
-    @field_validator("input_schema", "output_schema", mode="before")
-    @classmethod
-    def parse_schema(cls, v: Any) -> SchemaObject:
-        """Validate and parse schema fields into SchemaObject instances.
-
-        Args:
-            v: The raw schema value, either a dict or SchemaObject.
-
-        Returns:
-            A SchemaObject instance parsed from the input.
-
-        Raises:
-            ValueError: If the input is neither a dict nor a SchemaObject.
-        """
-        if isinstance(v, dict):
-            return SchemaObject.from_dict(v)
-        if not isinstance(v, SchemaObject):
-            raise ValueError(f"Expected dict or SchemaObject, got {type(v)}")
-        return v
+    input_schema: _Schema = Field(description="JSON schema for the input parameters")
+    output_schema: _Schema = Field(description="JSON schema for the output response")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Reassigning a field invalidates everything derived from it.
+        if name in type(self).model_fields:
+            self._clear_caches()
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._clear_caches()
+        return copied
+
+    def _clear_caches(self) -> None:
+        """Drop the values memoized from this endpoint's fields."""
+        self.__dict__.pop("_id_str", None)
+        self.__dict__.pop("_markdown", None)
 
     def execute(self, data: dict[str, Any] | None = None) -> Response:
         """Execute this endpoint with the provided input data.
@@ -62,7 +131,12 @@ class Endpoint(BaseModel):
         """
         if self._client is None:
             raise ValueError("Client not set. Cannot execute endpoint.")
-        return self._client.execute_from_endpoint_id(str(self.id), data=data)
+        return self._client.execute_from_endpoint_id(self._id_str, data=data)
+
+    @cached_property
+    def _id_str(self) -> str:
+        """The endpoint id as sent in request paths; kept outside __eq__."""
+        return str(self.id)
 
     def example_data(self) -> dict[str, Any]:
         """Generate example input data based on the endpoint's input schema.
@@ -70,7 +144,9 @@ class Endpoint(BaseModel):
         Returns:
             A dictionary containing example values for all input fields.
         """
-        return dict(self.input_schema.example_data())
+        # Copy so callers can't modify the schema's memoized example.
+        example: dict[str, Any] = _copy_json(self.input_schema.example_data())
+        return example
 
     def example_response(self) -> dict[str, Any]:
         """Generate example response data based on the endpoint's output schema.
@@ -78,56 +154,37 @@ class Endpoint(BaseModel):
         Returns:
             A dictionary containing example values for all output fields.
         """
-        return dict(self.output_schema.example_data())
+        example: dict[str, Any] = _copy_json(self.output_schema.example_data())
+        return example
 
     def make_markdown_documentation(self) -> str:
         """Generate markdown documentation for this API endpoint.
 
         Creates comprehensive documentation including input/output schemas,
-        code examples, and example responses.
+        code examples, and example responses. The result is rendered once and
+        reused by later calls until one of the endpoint's fields is reassigned.
 
         Returns:
             A formatted markdown string documenting the API endpoint.
         """
-        lines = [f"# {self.name}", ""]
-
-        if self.description:
-            lines.extend([f"> {self.description}", ""])
-
-        # Input section
-        lines.extend(["## Input", ""])
-        lines.append(self.input_schema.to_markdown_table())
-
-        # Build Python snippet for example request
-        example_json = json.dumps(self.example_data(), indent=4)
-        # Indent the data dict to align with the data= parameter
-        indented_data = "\n".join(
-            "    " + line if i > 0 else line
-            for i, line in enumerate(example_json.split("\n"))
+        return self._markdown
+
+    @cached_property
+    def _markdown(self) -> str:
+        """The rendered documentation; kept in __dict__, outside __eq__."""
+        # Indent the example data dict to align with the data= parameter
+        indented_data = textwrap.indent(self.input_schema.example_json(4), "    ")[4:]
+
+        return _DOC_TEMPLATE.format(
+            name=self.name,
+            description=f"> {self.description}\n\n" if self.description else "",
+            input_table=self.input_schema.to_markdown_table(),
+            endpoint_id=self.id,
+            data=indented_data,
+            output_table=self.output_schema.to_markdown_table(),
+            example_response=self.output_schema.example_json(2),
         )
 
-        snippet = f'''from revrseai import RevrseAI
-
-client = RevrseAI("YOUR_API_KEY")
-resp = client.execute(
-    endpoint_id="{self.id}",
-    data={indented_data}
-)
-print(resp)'''
-
-        lines.extend(["", "### Code Example", "", "```python"])
-        lines.append(snippet)
-        lines.extend(["```", ""])
-
-        # Output section
-        lines.extend(["## Output", ""])
-        lines.append(self.output_schema.to_markdown_table())
-        lines.extend(["", "### Example Response", "", "```json"])
-        lines.append(json.dumps(self.example_response(), indent=2))
-        lines.extend(["```"])
-
-        return "\n".join(lines)
-
     def print_markdown_documentation(self) -> None:
         """Print the endpoint's markdown documentation to stdout."""
         print(self.make_markdown_documentation())
@@ -138,5 +195,5 @@ print(resp)'''
         Args:
             filename: The path to the file where documentation will be written.
         """
-        with open(filename, "w") as f:
-            f.write(self.make_markdown_documentation())
+        with open(filename, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.write(self.make_markdown_documentation().encode("utf-8"))
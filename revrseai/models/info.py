@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 
-from .endpoint import Endpoint
+from .endpoint import _EXPORT_BUFFER_SIZE, Endpoint
 
 
 class Info(BaseModel):
@@ -24,15 +24,10 @@ class Info(BaseModel):
         Returns:
             A formatted markdown string documenting the app and its API endpoints.
         """
-        lines = [f"# {self.app_title or self.app_name}", ""]
-
-        lines.extend(["## Endpoints", ""])
-
-        for endpoint in self.endpoints:
-            lines.append(endpoint.make_markdown_documentation())
-            lines.append("")
-
-        return "\n".join(lines)
+        pages = "".join(
+            f"\n{e.make_markdown_documentation()}\n" for e in self.endpoints
+        )
+        return f"# {self.app_title or self.app_name}\n\n## Endpoints\n{pages}"
 
     def print_markdown_documentation(self) -> None:
         """Print the app's markdown documentation to stdout."""
@@ -44,5 +39,5 @@ class Info(BaseModel):
         Args:
             filename: The path to the file where documentation will be written.
         """
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(self.make_markdown_documentation())
+        with open(filename, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.write(self.make_markdown_documentation().encode("utf-8"))
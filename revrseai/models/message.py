@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Role(str, Enum):
@@ -17,6 +17,9 @@ class Role(str, Enum):
 class Message(BaseModel):
     """Base model with common fields."""
 
+    # Messages are history records and are never modified once loaded.
+    model_config = ConfigDict(frozen=True)
+
     task_id: UUID | None = Field(None, description="Task identifier")
     role: Role = Field(..., description="Message role ('user' or 'agent')")
     content: str = Field(..., description="Message content")
@@ -2,16 +2,135 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
-class SchemaObject:
+# Marks a memoized value that hasn't been computed yet (None is a valid result).
+_UNSET: Any = object()
+
+# Example values for schemas of a primitive type.
+_LEAF_EXAMPLES: dict[str, Any] = {
+    "string": "...",
+    "integer": 0,
+    "number": 0.0,
+    "boolean": False,
+}
+
+
+def _dumps(obj: Any, indent: int) -> str:
+    """Serialize obj like json.dumps(obj, indent=indent), using orjson if present.
+
+    orjson only indents by two spaces, so its output is re-indented to the
+    requested width. json is used whenever orjson's output could differ.
+    """
+    if orjson is not None and _orjson_compatible(obj):
+        try:
+            text = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+        else:
+            # json escapes non-ASCII text and DEL; orjson writes them as is.
+            if text.isascii() and "\x7f" not in text:
+                return text if indent == 2 else _reindent(text, indent)
+    return json.dumps(obj, indent=indent)
+
+
+def _orjson_compatible(obj: Any) -> bool:
+    """Whether every float in obj is formatted the same by json and orjson.
+
+    The two disagree on where to switch to exponent notation and on NaN and
+    Infinity, but agree on integral floats below 1e16.
+    """
+    if isinstance(obj, float):
+        return obj.is_integer() and abs(obj) < 1e16
+    if isinstance(obj, dict):
+        return all(_orjson_compatible(v) for v in obj.values())
+    if isinstance(obj, list):
+        return all(_orjson_compatible(v) for v in obj)
+    return True
+
+
+def _reindent(text: str, indent: int) -> str:
+    """Change the two-space indentation of orjson output to indent spaces."""
+    lines = []
+    for line in text.split("\n"):
+        content = line.lstrip(" ")
+        depth = (len(line) - len(content)) // 2
+        lines.append(" " * (depth * indent) + content)
+    return "\n".join(lines)
+
+
+# Markdown table header and row template used by to_markdown_table.
+_TABLE_HEADER = [
+    "| Field | Type | Required | Description |",
+    "|-------|------|----------|-------------|",
+]
+_ROW = "| {} | {} | {} | {} |".format
+
+# Keys of a schema dict that map onto SchemaObject fields; the rest go to _extra.
+_KNOWN_FIELDS = frozenset(
+    {
+        "type",
+        "format",
+        "description",
+        "title",
+        "nullable",
+        "enum",
+        "example",
+        "properties",
+        "required",
+        "items",
+    }
+)
+
+# Upper bound on the number of distinct leaf schemas kept for reuse.
+_LEAF_CACHE_MAXSIZE = 1024
+
+
+class _Memo:
+    """Slots holding SchemaObject's memoized renderings.
+
+    They live outside the dataclass fields so they stay out of init, repr,
+    comparisons, dataclasses.asdict and pydantic's schema and serialization.
+    """
+
+    __slots__ = (
+        "_example_cache",
+        "_example_json_cache",
+        "_md_cache",
+        "_formatted_type_cache",
+    )
+
+    _example_cache: Any
+    _example_json_cache: dict[int, str]
+    _md_cache: dict[tuple[str, ...], str]
+    _formatted_type_cache: str | None
+
+    def _reset_memo(self) -> None:
+        # The schema is not mutated after from_dict, so the memoized
+        # renderings never go stale.
+        self._example_cache = _UNSET
+        self._example_json_cache = {}
+        self._md_cache = {}
+        self._formatted_type_cache = None
+
+
+@dataclass(slots=True)
+class SchemaObject(_Memo):
     """
     Represents an OpenAPI Schema Object (subset of JSON Schema).
 
     Provides structured access to schema properties.
+
+    Instances built by from_dict must be treated as read-only: identical leaf
+    schemas are shared between every schema parsed in the process, and
+    renderings are memoized on first use.
     """
 
     # Common fields
@@ -33,6 +152,14 @@ class SchemaObject:
     # Escape hatch for additional/arbitrary properties
     _extra: dict[str, Any] = field(default_factory=dict)
 
+    # Shared instances of plain leaf schemas such as {"type": "string"}, keyed
+    # by their scalar fields. Schemas are read-only once parsed, so from_dict
+    # can hand out the same object (and its memoized renderings) everywhere.
+    _LEAF_CACHE: ClassVar[dict[tuple[Any, ...], SchemaObject]] = {}
+
+    def __post_init__(self) -> None:
+        self._reset_memo()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to OpenAPI dictionary format."""
         result: dict[str, Any] = {}
@@ -72,32 +199,43 @@ class SchemaObject:
         """Create from dictionary."""
         # Extract known fields
         properties = {}
-        if "properties" in data:
-            for name, prop_data in data["properties"].items():
-                properties[name] = (
-                    cls.from_dict(prop_data) if isinstance(prop_data, dict) else cls()
-                )
-
-        items = None
-        if "items" in data and isinstance(data["items"], dict):
-            items = cls.from_dict(data["items"])
-
-        # Collect extra fields not explicitly handled
-        known_fields = {
-            "type",
-            "format",
-            "description",
-            "title",
-            "nullable",
-            "enum",
-            "example",
-            "properties",
-            "required",
-            "items",
-        }
-        extra = {k: v for k, v in data.items() if k not in known_fields}
-
-        return cls(
+        for name, prop_data in data.get("properties", {}).items():
+            properties[name] = (
+                cls.from_dict(prop_data) if isinstance(prop_data, dict) else cls()
+            )
+
+        items = data.get("items")
+        items = cls.from_dict(items) if isinstance(items, dict) else None
+
+        # Collect extra fields not explicitly handled, keeping their order
+        extra = (
+            {k: v for k, v in data.items() if k not in _KNOWN_FIELDS}
+            if data.keys() - _KNOWN_FIELDS
+            else {}
+        )
+
+        leaf_key = None
+        if not (properties or items or extra or data.get("required")) and (
+            data.get("enum") is None and data.get("example") is None
+        ):
+            scalars = (
+                data.get("type"),
+                data.get("format"),
+                data.get("description"),
+                data.get("title"),
+            )
+            nullable = data.get("nullable", False)
+            # Only intern well-formed leaves; anything else (a type list, say)
+            # may be unhashable and is simply built fresh.
+            if isinstance(nullable, bool) and all(
+                v is None or isinstance(v, str) for v in scalars
+            ):
+                leaf_key = (cls, *scalars, nullable)
+                leaf = cls._LEAF_CACHE.get(leaf_key)
+                if leaf is not None:
+                    return leaf
+
+        schema = cls(
             type=data.get("type"),
             format=data.get("format"),
             description=data.get("description"),
@@ -110,9 +248,30 @@ class SchemaObject:
             items=items,
             _extra=extra,
         )
+        if leaf_key is not None and len(cls._LEAF_CACHE) < _LEAF_CACHE_MAXSIZE:
+            schema = cls._LEAF_CACHE.setdefault(leaf_key, schema)
+        return schema
 
     def example_data(self) -> Any:
-        """Generate example data based on the schema structure."""
+        """Generate example data based on the schema structure.
+
+        The result is computed once and shared by later calls, so callers
+        must copy it before mutating it.
+        """
+        if self._example_cache is _UNSET:
+            self._example_cache = self._build_example_data()
+        return self._example_cache
+
+    def example_json(self, indent: int) -> str:
+        """Return example_data() serialized as JSON with the given indent."""
+        example = self._example_json_cache.get(indent)
+        if example is None:
+            example = _dumps(self.example_data(), indent)
+            self._example_json_cache[indent] = example
+        return example
+
+    def _build_example_data(self) -> Any:
+        """Build the example value for this schema node."""
         if self.example is not None:
             return self.example
 
@@ -127,22 +286,20 @@ class SchemaObject:
                 return [self.items.example_data()]
             return []
 
-        if self.type == "string":
-            return "..."
-
-        if self.type == "integer":
-            return 0
-
-        if self.type == "number":
-            return 0.0
-
-        if self.type == "boolean":
-            return False
-
-        return None
+        # type may also be a JSON Schema type list, which has no example.
+        if not isinstance(self.type, str):
+            return None
+        return _LEAF_EXAMPLES.get(self.type)
 
     def _format_type(self) -> str:
         """Format the type string for display."""
+        if self._formatted_type_cache is None:
+            # mypy doesn't see slots a slotted dataclass inherits from _Memo.
+            self._formatted_type_cache = self._build_type_string()  # type: ignore[misc]
+        return self._formatted_type_cache
+
+    def _build_type_string(self) -> str:
+        """Render the type string for _format_type."""
         type_str = self.type or "any"
         if self.format:
             type_str = f"{type_str} ({self.format})"
@@ -154,20 +311,26 @@ class SchemaObject:
 
     def to_markdown_table(self, required_fields: list[str] | None = None) -> str:
         """Generate a markdown table from schema properties."""
+        key = tuple(required_fields or ())
+        table = self._md_cache.get(key)
+        if table is None:
+            table = self._md_cache[key] = self._build_markdown_table(required_fields)
+        return table
+
+    def _build_markdown_table(self, required_fields: list[str] | None) -> str:
+        """Render the markdown table for to_markdown_table."""
         if not self.properties:
             return "_No fields_"
 
-        required_fields = required_fields or self.required or []
+        required = set(required_fields or self.required or ())
 
-        lines = [
-            "| Field | Type | Required | Description |",
-            "|-------|------|----------|-------------|",
+        rows = [
+            _ROW(
+                name,
+                prop._format_type(),
+                "Yes" if name in required else "No",
+                prop.description or "-",
+            )
+            for name, prop in self.properties.items()
         ]
-
-        for name, prop in self.properties.items():
-            is_required = "Yes" if name in required_fields else "No"
-            desc = prop.description or "-"
-            type_str = prop._format_type()
-            lines.append(f"| {name} | {type_str} | {is_required} | {desc} |")
-
-        return "\n".join(lines)
+        return "\n".join(_TABLE_HEADER + rows)
@@ -6,12 +6,17 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, PrivateAttr
 
-from .endpoint import Endpoint
+from .endpoint import _EXPORT_BUFFER_SIZE, Endpoint
 from .message import Message
 
 if TYPE_CHECKING:
     from revrseai.client import RevrseAI
 
+# Task.wait_till_done polling schedule, in seconds.
+_POLL_INITIAL_DELAY = 0.5
+_POLL_BACKOFF = 1.5
+_POLL_MAX_DELAY = 10.0
+
 
 class TaskStage(str, Enum):
     """Enum for task stage types."""
@@ -39,22 +44,31 @@ class Task(BaseModel):
         """Fetch fresh task data and update all fields."""
         if self._client is None:
             raise ValueError("Client not set. Cannot update task.")
-        fresh = self._client.get_task_basic(str(self.id))
-        for field in self.__class__.model_fields:
-            setattr(self, field, getattr(fresh, field))
+        fresh = self._client.get_task_basic(str(self.id), use_cache=False)
+        # fresh is already validated, so copy its fields over wholesale.
+        self.__dict__.update(fresh.__dict__)
+        object.__setattr__(
+            self, "__pydantic_fields_set__", set(fresh.__pydantic_fields_set__)
+        )
         return self
 
     def get_detailed(self) -> "TaskDetailed":
         """Fetch the detailed version of this task."""
         if self._client is None:
             raise ValueError("Client not set. Cannot get detailed task.")
-        return self._client.get_task(str(self.id))
+        return self._client.get_task(str(self.id), use_cache=False)
 
     def wait_till_done(self) -> "TaskDetailed":
-        """Wait until the task is done and return the detailed task."""
-        while self.task_stage != TaskStage.DONE:
+        """Wait until the task is done and return the detailed task.
+
+        The task is polled often at first and then progressively less, up to
+        every _POLL_MAX_DELAY seconds.
+        """
+        delay = _POLL_INITIAL_DELAY
+        while self.task_stage is not TaskStage.DONE:
+            time.sleep(delay)
             self.update()
-            time.sleep(10)
+            delay = min(delay * _POLL_BACKOFF, _POLL_MAX_DELAY)
         return self.get_detailed()
 
 
@@ -66,9 +80,12 @@ class TaskDetailed(Task):
         """Fetch fresh task data and update all fields."""
         if self._client is None:
             raise ValueError("Client not set. Cannot update task.")
-        fresh = self._client.get_task(str(self.id))
-        for field in self.__class__.model_fields:
-            setattr(self, field, getattr(fresh, field))
+        fresh = self._client.get_task(str(self.id), use_cache=False)
+        # fresh is already validated, so copy its fields over wholesale.
+        self.__dict__.update(fresh.__dict__)
+        object.__setattr__(
+            self, "__pydantic_fields_set__", set(fresh.__pydantic_fields_set__)
+        )
         for endpoint in self.endpoints:
             endpoint._client = self._client
         return self
@@ -79,18 +96,11 @@ class TaskDetailed(Task):
         Returns:
             A formatted markdown string documenting the task and its API endpoints.
         """
-        lines = [f"# {self.title}", ""]
-
-        if self.description:
-            lines.extend([f"> {self.description}", ""])
-
-        lines.extend(["## Endpoints", ""])
-
-        for endpoint in self.endpoints:
-            lines.append(endpoint.make_markdown_documentation())
-            lines.append("")
-
-        return "\n".join(lines)
+        description = f"> {self.description}\n\n" if self.description else ""
+        pages = "".join(
+            f"\n{e.make_markdown_documentation()}\n" for e in self.endpoints
+        )
+        return f"# {self.title}\n\n{description}## Endpoints\n{pages}"
 
     def print_markdown_documentation(self) -> None:
         """Print the task's markdown documentation to stdout."""
@@ -102,5 +112,5 @@ class TaskDetailed(Task):
         Args:
             filename: The path to the file where documentation will be written.
         """
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(self.make_markdown_documentation())
+        with open(filename, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.write(self.make_markdown_documentation().encode("utf-8"))